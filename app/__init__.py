@@ -1,13 +1,11 @@
-from typing import List
-
 from flask import Flask
 
 from app.blueprints.api import api_bp
 from app.blueprints.main import main_bp
-from app.models.config import INSConfig
+from app.models.config import INSConfigIndex
 
 
-def create_app(ins_configs: List[INSConfig] = None):
+def create_app(ins_configs: INSConfigIndex = None):
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
     app.config['INS_CONFIGS'] = ins_configs
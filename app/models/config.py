@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class INSConfig:
     id: str
     name: str
@@ -13,3 +13,34 @@ class INSConfig:
     serial_port: Optional[str] = None
     serial_baudrate: int = 115200
     timeout: float = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class INSConfigIndex:
+    """Configured INS, indexed once at load time: iterable like the plain
+    list it replaces, with O(1) lookup by id and prefiltered per-type
+    tuples."""
+
+    all: Tuple[INSConfig, ...]
+    by_id: Dict[str, INSConfig] = field(repr=False)
+    ethernet: Tuple[INSConfig, ...] = field(repr=False)
+    fake: Tuple[INSConfig, ...] = field(repr=False)
+
+    @classmethod
+    def from_configs(cls, configs: Iterable[INSConfig]) -> "INSConfigIndex":
+        configs = tuple(configs)
+        by_id = {config.id: config for config in configs}
+        if len(by_id) != len(configs):
+            raise ValueError("Duplicate INS id in configuration")
+        return cls(
+            all=configs,
+            by_id=by_id,
+            ethernet=tuple(c for c in configs if c.connection_type == 'ethernet'),
+            fake=tuple(c for c in configs if c.connection_type == 'fake'),
+        )
+
+    def __iter__(self) -> Iterator[INSConfig]:
+        return iter(self.all)
+
+    def __len__(self) -> int:
+        return len(self.all)
@@ -1,10 +1,8 @@
-from typing import List
-
-from app.models.config import INSConfig
+from app.models.config import INSConfigIndex
 from app.monitoring.scheduler.monitoring_scheduler import MonitoringScheduler
 
 
-def create_monitor(ins_configs: List[INSConfig] = None):
+def create_monitor(ins_configs: INSConfigIndex = None):
     monitoring_scheduler = MonitoringScheduler()
     monitoring_scheduler.setup(ins_configs)
     return monitoring_scheduler
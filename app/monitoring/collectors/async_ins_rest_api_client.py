@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, Dict
+
+import aiohttp
+import orjson
+
+
+class AsyncInsRestApiClient:
+    _API_PREFIX: str = "/api/v1"
+    _DEFAULT_HEADERS: Dict[str, str] = {"Accept": "application/json"}
+    _REQUEST_TIMEOUT_SECONDS: float = 5.0
+
+    def __init__(self, ip_address: str, port: int = 80):
+        self._base_url = f"http://{ip_address}:{port}"
+        self._timeout = aiohttp.ClientTimeout(total=self._REQUEST_TIMEOUT_SECONDS)
+
+    async def fetch_data(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        ins_data = {}
+        try:
+            ins_data['status'], ins_data['ins_measurement'] = await asyncio.gather(
+                self._get_json(session, "status"),
+                self._get_json(session, "data"))
+            ins_data['online'] = True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            ins_data['online'] = False
+            ins_data['error_message'] = str(exc)
+        else:
+            gnss1, gnss2, datalogger = await asyncio.gather(
+                self._get_json(session, "gnss1"),
+                self._get_json(session, "gnss2"),
+                self._get_json(session, "dataLogger"),
+                return_exceptions=True)
+            ins_data['gnss1_measurement'] = None if isinstance(gnss1, BaseException) else gnss1
+            ins_data['gnss2_measurement'] = None if isinstance(gnss2, BaseException) else gnss2
+            ins_data['datalogger'] = None if isinstance(datalogger, BaseException) else datalogger
+
+        return ins_data
+
+    def _build_url(self, path: str) -> str:
+        return f"{self._base_url}{self._API_PREFIX}/{path}"
+
+    async def _get_json(self, session: aiohttp.ClientSession, path: str) -> Dict[str, Any]:
+        url = self._build_url(path)
+        async with session.get(url, headers=self._DEFAULT_HEADERS, timeout=self._timeout) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
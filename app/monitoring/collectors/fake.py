@@ -1,14 +1,16 @@
-import json
 import os
 from typing import Any, Dict
 
+import orjson
+
 
 class FakeIns:
 
     def __init__(self):
-        pass
+        # The file is static: parse it once at construction
+        with open(os.path.join(os.path.dirname(__file__), 'fake_data.json'), 'rb') as f:
+            self._data = orjson.loads(f.read())
 
     def fetch_data(self) -> Dict[str, Any]:
-        with open(os.path.join(os.path.dirname(__file__), 'fake_data.json'), 'r') as f:
-            return json.load(f)
-        return {}
+        # Callers treat the payload as read-only, no copy needed
+        return self._data
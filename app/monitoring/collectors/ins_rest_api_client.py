@@ -1,39 +1,61 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
-from typing import Any, Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional
 
 class InsRestApiClient:
     _API_PREFIX: str = "/api/v1"
     _DEFAULT_HEADERS: Dict[str, str] = {"Accept": "application/json"}
     _REQUEST_TIMEOUT_SECONDS: float = 5.0
 
+    # One keep-alive session shared by every client: urllib3 keeps a
+    # connection pool per INS host, so sockets are reused across ticks and
+    # instances instead of re-handshaking
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
     def __init__(self, ip_address: str, port: int = 80):
         self._base_url = f"http://{ip_address}:{port}"
+        self._session = self._shared_session()
+        self._pool = ThreadPoolExecutor(max_workers=4)
+
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    session.mount("http://", HTTPAdapter(pool_connections=10,
+                                                         pool_maxsize=4,
+                                                         max_retries=0))
+                    cls._session = session
+        return cls._session
 
     def fetch_data(self) -> Dict[str, Any]:
         ins_data = {}
         try:
-            ins_data['status'] = self._get_json("status")
-            ins_data['ins_measurement'] = self._get_json("data")
+            status_future = self._pool.submit(self._get_json, "status")
+            data_future = self._pool.submit(self._get_json, "data")
+            ins_data['status'] = status_future.result()
+            ins_data['ins_measurement'] = data_future.result()
             ins_data['online'] = True
         except requests.RequestException as exc:
             ins_data['online'] = False
             ins_data['error_message'] = str(exc)
         else:
-            try:
-                ins_data['gnss1_measurement'] = self._get_json("gnss1")
-            except requests.RequestException as exc:
-                ins_data['gnss1_measurement'] = None
-            
-            try:
-                ins_data['gnss2_measurement'] = self._get_json("gnss2")
-            except requests.RequestException as exc:
-                ins_data['gnss1_measurement'] = None
-            
-            try:
-                ins_data['datalogger'] = self._get_json("dataLogger")
-            except requests.RequestException as exc:
-                ins_data['datalogger'] = None
-            
+            futures = {key: self._pool.submit(self._get_json, path)
+                       for key, path in (('gnss1_measurement', 'gnss1'),
+                                         ('gnss2_measurement', 'gnss2'),
+                                         ('datalogger', 'dataLogger'))}
+            for key, future in futures.items():
+                try:
+                    ins_data[key] = future.result()
+                except requests.RequestException:
+                    ins_data[key] = None
+
         return ins_data
 
     def _build_url(self, path: str) -> str:
@@ -41,6 +63,6 @@ class InsRestApiClient:
 
     def _get_json(self, path: str) -> Dict[str, Any]:
         url = self._build_url(path)
-        response = requests.get(url, headers=self._DEFAULT_HEADERS, timeout=self._REQUEST_TIMEOUT_SECONDS)
+        response = self._session.get(url, headers=self._DEFAULT_HEADERS, timeout=self._REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
@@ -1,13 +1,15 @@
+import asyncio
 import threading
 import time
 import logging
 
-from app.monitoring.collectors.ins_rest_api_client import InsRestApiClient
+import aiohttp
+
+from app.monitoring.collectors.async_ins_rest_api_client import AsyncInsRestApiClient
 from app.monitoring.collectors.fake import FakeIns
 from app.storage.cache_manager import get_or_create_cache
-from typing import List
 
-from app.models.config import INSConfig
+from app.models.config import INSConfigIndex
 
 logger = logging.getLogger(__name__)
 
@@ -15,22 +17,23 @@ class MonitoringScheduler:
     def __init__(self):
         self._running = False
         self._monitor_thread = None
-        self._update_interval_ns: float = 1e9
-        self._clients = {}
+        self._update_interval_s: float = 1.0
+        # (ins_id, client) pairs: iteration order is stable and sequential
+        self._clients = []
 
-    def setup(self, ins_configs: List[INSConfig] = None):
+    def setup(self, ins_configs: INSConfigIndex = None):
         for ins_config in ins_configs:
             if ins_config.connection_type == 'ethernet':
-                self._clients[ins_config.id] = InsRestApiClient(ins_config.ip_address)
+                self._clients.append((ins_config.id, AsyncInsRestApiClient(ins_config.ip_address)))
             elif ins_config.connection_type == 'fake':
-                self._clients[ins_config.id] = FakeIns()
+                self._clients.append((ins_config.id, FakeIns()))
 
     def start(self):
         if self._running:
             return
 
         self._running = True
-        self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._monitor_thread = threading.Thread(target=self._run_async_loop, daemon=True)
         self._monitor_thread.start()
 
     def stop(self):
@@ -38,21 +41,40 @@ class MonitoringScheduler:
         if self._monitor_thread:
             self._monitor_thread.join(timeout=10)
 
-    def _monitor_loop(self):
+    def _run_async_loop(self):
+        asyncio.run(self._async_loop())
+
+    async def _async_loop(self):
 
         cache = get_or_create_cache()
 
-        while self._running:
-            start_time = time.time_ns()
-            for ins_id, client in self._clients.items():
-                try:
-                    data = client.fetch_data()
-                    cache.store_data(ins_id, data)
-                except Exception as e:
-                    logger.error(f"Error on fetching data for {ins_id}: {e}")
-
-            # Adjust to update_interval
-            elapsed = time.time_ns() - start_time
-            sleep_time = max(0., self._update_interval_ns - elapsed)
-            if sleep_time > 0:
-                time.sleep(sleep_time * 1e-9)
+        # One session for the whole loop so TCP connections are kept alive
+        # and reused from tick to tick
+        connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Drift-compensated pacing on the monotonic clock: the mean tick
+            # rate stays locked to update_interval even when a tick overruns,
+            # and NTP wall-clock jumps cannot disturb it
+            next_deadline = time.monotonic()
+            while self._running:
+                await asyncio.gather(*(self._fetch_one(session, cache, ins_id, client)
+                                       for ins_id, client in self._clients))
+
+                next_deadline += self._update_interval_s
+                sleep_time = next_deadline - time.monotonic()
+                if sleep_time > 0:
+                    await asyncio.sleep(sleep_time)
+                else:
+                    # More than one interval behind: skip ahead instead of
+                    # firing back-to-back ticks to catch up
+                    next_deadline = time.monotonic()
+
+    async def _fetch_one(self, session, cache, ins_id, client):
+        try:
+            if isinstance(client, AsyncInsRestApiClient):
+                data = await client.fetch_data(session)
+            else:
+                data = client.fetch_data()
+            cache.store_data(ins_id, data)
+        except Exception as e:
+            logger.error(f"Error on fetching data for {ins_id}: {e}")
@@ -5,22 +5,32 @@ from app.storage.memory_store import HybridMemoryStore
 
 class CacheManager:
     _instance = None
-    _lock = threading.RLock()
+    # Plain Lock: nothing here recurses, so RLock's owner bookkeeping is
+    # pure overhead
+    _lock = threading.Lock()
     _store: HybridMemoryStore = None
 
     def __new__(cls):
+        if cls._instance is not None:
+            return cls._instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
             return cls._instance
 
     def get_or_create_cache(self) -> HybridMemoryStore:
+        # Double-checked locking: the store is created once, afterwards this
+        # is a lock-free attribute read on every call
+        if self._store is not None:
+            return self._store
         with self._lock:
             if self._store is None:
-                self._store = HybridMemoryStore()
+                CacheManager._store = HybridMemoryStore()
             return self._store
 
 
+_MANAGER = CacheManager()
+
+
 def get_or_create_cache() -> HybridMemoryStore:
-    manager = CacheManager()
-    return manager.get_or_create_cache()
+    return _MANAGER.get_or_create_cache()
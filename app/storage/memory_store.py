@@ -1,144 +1,343 @@
+import heapq
+import sched
 import threading
 import time
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
-from typing import Dict, List, Optional, Any
+import types
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Mapping, Optional, Any, Tuple, Union
 
+import numpy as np
+from readerwriterlock import rwlock
 
-class MemoryCache:
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._timestamps: Dict[str, float] = {}
-        self._lock = threading.RLock()
+# One scheduler thread shared by all periodic maintenance tasks in this
+# module, instead of a dedicated sleeping thread per store
+_CLEANUP_SCHEDULER = sched.scheduler(time.monotonic, time.sleep)
+_cleanup_thread_started = False
+_cleanup_guard = threading.Lock()
 
-        self._cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
-        self._cleanup_thread.start()
 
-    def set(self, key: str, value: Any, ttl: int = 300):
-        with self._lock:
-            self._cache[key] = {
-                'value': value,
-                'ttl': ttl,
-                'created_at': time.time()
-            }
-            self._timestamps[key] = time.time() + ttl
+def _run_cleanup_loop():
+    while True:
+        _CLEANUP_SCHEDULER.run()
+        # Queue drained (no tasks registered yet); idle briefly
+        time.sleep(1.)
 
-    def get(self, key: str) -> Optional[Any]:
-        with self._lock:
-            if key not in self._cache:
-                return None
 
-            item = self._cache[key]
-            if time.time() > item['created_at'] + item['ttl']:
-                del self._cache[key]
-                del self._timestamps[key]
-                return None
+def _schedule_periodic(interval: float, callback: Callable[[], None]):
+    """Run callback every interval seconds on the shared cleanup thread."""
+    def _tick():
+        try:
+            callback()
+        except Exception:
+            pass
+        _CLEANUP_SCHEDULER.enter(interval, 1, _tick)
 
-            return item['value']
+    _CLEANUP_SCHEDULER.enter(interval, 1, _tick)
+    global _cleanup_thread_started
+    with _cleanup_guard:
+        if not _cleanup_thread_started:
+            threading.Thread(target=_run_cleanup_loop, daemon=True).start()
+            _cleanup_thread_started = True
 
-    def delete(self, key: str):
-        with self._lock:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
 
-    def keys(self) -> List[str]:
-        with self._lock:
-            current_time = time.time()
-            valid_keys = []
-            for key, expire_time in self._timestamps.items():
-                if current_time <= expire_time:
-                    valid_keys.append(key)
-            return valid_keys
+class _CacheShard:
+    """One stripe of MemoryCache: its own dict, expiry heap and RWLock."""
 
-    def clear(self):
-        with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+    __slots__ = ('cache', 'heap', 'lock')
 
-    def _cleanup_expired(self):
-        while True:
-            try:
-                time.sleep(60)
-                current_time = time.time()
+    def __init__(self):
+        self.cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.heap: List[Tuple[float, str]] = []
+        self.lock = rwlock.RWLockFair()
 
-                with self._lock:
-                    expired_keys = [
-                        key for key, expire_time in self._timestamps.items()
-                        if current_time > expire_time
-                    ]
 
-                    for key in expired_keys:
-                        self._cache.pop(key, None)
-                        self._timestamps.pop(key, None)
+class MemoryCache:
+    """TTL cache with lazy expiration and an LRU size bound.
+
+    Keys are striped over independent shards by hash, so writers on
+    different keys take different locks and proceed in parallel. Within a
+    shard, reads share a reader lock; expired entries are simply skipped
+    when read and memory is bounded per shard by LRU eviction. A periodic
+    reap task shared by all instances pops the expiry heaps so untouched
+    expired keys are still reclaimed in O(log n) each, without
+    per-instance threads or full-dict sweeps.
+    """
+
+    _NUM_SHARDS = 16
+    _REAP_INTERVAL_S = 60.
+
+    _instances: "weakref.WeakSet[MemoryCache]" = weakref.WeakSet()
+    _reaper_started = False
+    _reaper_guard = threading.Lock()
+
+    def __init__(self, max_size: int = 10_000):
+        self._shards = [_CacheShard() for _ in range(self._NUM_SHARDS)]
+        self._max_shard_size = max(1, max_size // self._NUM_SHARDS)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._register(self)
+
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % self._NUM_SHARDS]
+
+    @classmethod
+    def _register(cls, instance: "MemoryCache"):
+        cls._instances.add(instance)
+        if not cls._reaper_started:
+            with cls._reaper_guard:
+                if not cls._reaper_started:
+                    _schedule_periodic(cls._REAP_INTERVAL_S, cls._reap_all)
+                    cls._reaper_started = True
+
+    @classmethod
+    def _reap_all(cls):
+        for instance in list(cls._instances):
+            instance._reap_expired()
+
+    def _reap_expired(self):
+        current_time = time.monotonic()
+        for shard in self._shards:
+            if not shard.heap or shard.heap[0][0] > current_time:
+                continue
+            with shard.lock.gen_wlock():
+                while shard.heap and shard.heap[0][0] <= current_time:
+                    expiry, key = heapq.heappop(shard.heap)
+                    item = shard.cache.get(key)
+                    # Heap entries made stale by a later set() are skipped
+                    if item is not None and item[0] == expiry:
+                        del shard.cache[key]
 
-            except Exception:
-                pass
+    def set(self, key: str, value: Any, ttl: int = 300):
+        # Build everything before taking the lock; only the mutations stay
+        # inside the critical section
+        expiry = time.monotonic() + ttl
+        item = (expiry, value)
+        heap_entry = (expiry, key)
+        shard = self._shard(key)
+        with shard.lock.gen_wlock():
+            shard.cache[key] = item
+            shard.cache.move_to_end(key)
+            heapq.heappush(shard.heap, heap_entry)
+            if len(shard.cache) > self._max_shard_size:
+                shard.cache.popitem(last=False)
 
+    def get(self, key: str) -> Optional[Any]:
+        shard = self._shard(key)
+        with shard.lock.gen_rlock():
+            item = shard.cache.get(key)
+            # Expired entries are left for LRU eviction so the read path
+            # never needs the writer lock
+            if item is None or time.monotonic() > item[0]:
+                return None
+            return item[1]
+
+    def get_or_compute(self, key: str, compute_fn: Callable[[], Any], ttl: int = 300) -> Any:
+        """Return the cached value for key, computing and storing it on miss.
+
+        A per-key lock makes sure that when several threads miss the same
+        expired key at once, only one runs compute_fn and the rest wait for
+        its result instead of stampeding.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._key_locks_guard:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Re-check: another thread may have computed while we waited
+            value = self.get(key)
+            if value is None:
+                value = compute_fn()
+                self.set(key, value, ttl)
+            return value
 
-class TimeSeriesMemoryStore:
-    def __init__(self, max_history_hours: int = 24):
-        self._data: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self._latest: Dict[str, Dict] = {}
-        self._lock = threading.RLock()
-        self._max_history_hours = max_history_hours
+    def delete(self, key: str):
+        shard = self._shard(key)
+        with shard.lock.gen_wlock():
+            shard.cache.pop(key, None)
 
-        self._cleanup_thread = threading.Thread(target=self._cleanup_old_data, daemon=True)
-        self._cleanup_thread.start()
+    def keys(self) -> List[str]:
+        # No cross-shard snapshot consistency needed, collect per shard
+        current_time = time.monotonic()
+        valid_keys = []
+        for shard in self._shards:
+            with shard.lock.gen_rlock():
+                valid_keys.extend(key for key, (expiry, _) in shard.cache.items()
+                                  if current_time <= expiry)
+        return valid_keys
 
-    def store_metrics(self, metric_type: str, data: Dict[str, Any]):
-        timestamp = datetime.utcnow()
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock.gen_wlock():
+                shard.cache.clear()
+                shard.heap.clear()
+
+
+def _extract_position(data: Dict[str, Any]) -> Tuple[Optional[float], Optional[float], bool]:
+    """Pull (latitude, longitude, online) out of a raw INS payload once, at
+    store time, so queries never walk the nested dicts again."""
+    online = bool(data.get('online'))
+    ekf = (data.get('ins_measurement') or {}).get('ekf') if online else None
+    if not ekf:
+        return None, None, online
+    return ekf.get('latitude'), ekf.get('longitude'), online
+
+
+class _PositionRingBuffer:
+    """Fixed-size SoA buffer of (timestamp, latitude, longitude, online)
+    samples, so position queries are vectorized instead of walking dicts."""
+
+    def __init__(self, capacity: int = 1000):
+        self._capacity = capacity
+        self._ts = np.empty(capacity)
+        self._lat = np.empty(capacity)
+        self._lon = np.empty(capacity)
+        self._online = np.empty(capacity, dtype=bool)
+        self._head = 0
+        self._count = 0
+
+    def append(self, ts: float, lat: float, lon: float, online: bool):
+        self._ts[self._head] = ts
+        self._lat[self._head] = lat
+        self._lon[self._head] = lon
+        self._online[self._head] = online
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        if self._count < self._capacity:
+            return array[:self._count]
+        return np.concatenate((array[self._head:], array[:self._head]))
+
+    def positions_since(self, cutoff: float) -> List[List[float]]:
+        mask = (self._ordered(self._ts) >= cutoff) & self._ordered(self._online)
+        return np.column_stack((self._ordered(self._lat)[mask],
+                                self._ordered(self._lon)[mask])).tolist()
+
+
+def _as_epoch(value: Union[float, datetime]) -> float:
+    # Normalize once at the query boundary; everything below compares floats
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+@dataclass(slots=True)
+class _Entry:
+    """One stored sample: two slots instead of a 2-key dict per sample."""
+    timestamp: float
+    data: Dict[str, Any]
+
+
+class _EntryRingBuffer:
+    """Fixed-size ring of raw entries with a parallel float64 timestamp
+    column: range queries binary-search the contiguous timestamp array with
+    np.searchsorted and slice the matching entries."""
+
+    def __init__(self, capacity: int = 1000):
+        self._capacity = capacity
+        self._ts = np.empty(capacity)
+        self._entries: List[Optional[_Entry]] = [None] * capacity
+        self._head = 0
+        self._count = 0
+
+    def append(self, ts: float, entry: _Entry):
+        self._ts[self._head] = ts
+        self._entries[self._head] = entry
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def range(self, start_time: float, end_time: float) -> List[_Entry]:
+        if self._count < self._capacity:
+            ts = self._ts[:self._count]
+            entries = self._entries[:self._count]
+        else:
+            ts = np.concatenate((self._ts[self._head:], self._ts[:self._head]))
+            entries = self._entries[self._head:] + self._entries[:self._head]
+        lo = int(np.searchsorted(ts, start_time, side='left'))
+        hi = int(np.searchsorted(ts, end_time, side='right'))
+        return entries[lo:hi]
 
-        entry = {
-            'timestamp': timestamp,
-            'data': data
-        }
 
-        with self._lock:
-            self._data[metric_type].append(entry)
-            self._latest[metric_type] = entry
+class TimeSeriesMemoryStore:
 
-    def get_latest(self, metric_type: str) -> Optional[Dict]:
-        with self._lock:
-            return self._latest.get(metric_type)
+    def __init__(self):
+        # History is bounded by the ring-buffer capacities, so no periodic
+        # age-based sweep is needed. Plain dicts with explicit miss paths:
+        # reads never materialize empty buffers
+        self._data: Dict[str, _EntryRingBuffer] = {}
+        self._positions: Dict[str, _PositionRingBuffer] = {}
+        self._latest: Dict[str, _Entry] = {}
+        self._version = 0
+        self._lock = rwlock.RWLockFair()
 
-    def get_metrics_range(self, metric_type: str, start_time: datetime, end_time: datetime) -> List[Dict]:
-        with self._lock:
-            if metric_type not in self._data:
+    def store_metrics(self, metric_type: str, data: Dict[str, Any]):
+        # Epoch floats: ~10x cheaper to create and compare than datetime
+        timestamp = time.time()
+
+        entry = _Entry(timestamp, data)
+
+        lat, lon, online = _extract_position(data)
+
+        with self._lock.gen_wlock():
+            history = self._data.get(metric_type)
+            if history is None:
+                history = self._data[metric_type] = _EntryRingBuffer()
+            history.append(timestamp, entry)
+            if lat is not None and lon is not None:
+                positions = self._positions.get(metric_type)
+                if positions is None:
+                    positions = self._positions[metric_type] = _PositionRingBuffer()
+                positions.append(timestamp, lat, lon, online)
+
+        # Publish the latest snapshot as a copy-on-write dict: rebinding the
+        # reference is atomic under the GIL, so readers never need the lock
+        new_latest = dict(self._latest)
+        new_latest[metric_type] = entry
+        self._latest = new_latest
+        self._version += 1
+
+    def get_latest(self, metric_type: str) -> Optional[_Entry]:
+        return self._latest.get(metric_type)
+
+    def get_metrics_range(self, metric_type: str,
+                          start_time: Union[float, datetime],
+                          end_time: Union[float, datetime]) -> List[_Entry]:
+        start_time = _as_epoch(start_time)
+        end_time = _as_epoch(end_time)
+        with self._lock.gen_rlock():
+            history = self._data.get(metric_type)
+            if history is None:
                 return []
 
-            results = []
-            for entry in self._data[metric_type]:
-                if start_time <= entry['timestamp'] <= end_time:
-                    results.append(entry)
-
-            return sorted(results, key=lambda x: x['timestamp'])
+            # Binary search on the timestamp column; results come back in
+            # insertion (time) order already
+            return history.range(start_time, end_time)
 
-    def get_recent_metrics(self, metric_type: str, minutes: int = 30) -> List[Dict]:
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(minutes=minutes)
+    def get_recent_metrics(self, metric_type: str, minutes: int = 30) -> List[_Entry]:
+        end_time = time.time()
+        start_time = end_time - minutes * 60
         return self.get_metrics_range(metric_type, start_time, end_time)
 
     def get_all_recent(self, minutes: int = 30) -> Dict[str, List]:
         return {k: self.get_recent_metrics(k, minutes) for k in self._data.keys()}
 
-    def get_all_latest(self) -> Dict[str, Dict]:
-        with self._lock:
-            return self._latest.copy()
-
-    def _cleanup_old_data(self):
-        while True:
-            try:
-                time.sleep(300)
-                cutoff_time = datetime.utcnow() - timedelta(hours=self._max_history_hours)
+    def get_all_latest(self) -> Mapping[str, _Entry]:
+        # Snapshots are immutable once published, no copy or lock needed;
+        # the proxy makes that contract explicit to callers
+        return types.MappingProxyType(self._latest)
 
-                with self._lock:
-                    for metric_type in self._data:
-                        while (self._data[metric_type] and
-                               self._data[metric_type][0]['timestamp'] < cutoff_time):
-                            self._data[metric_type].popleft()
+    @property
+    def version(self) -> int:
+        """Bumped on every store; lets callers skip work when nothing changed."""
+        return self._version
 
-            except Exception:
-                pass
+    def get_positions(self, last_minutes: int = 5) -> Dict[str, List]:
+        cutoff = time.time() - last_minutes * 60
+        with self._lock.gen_rlock():
+            return {k: rb.positions_since(cutoff) for k, rb in self._positions.items()}
 
 
 class HybridMemoryStore:
@@ -147,22 +346,20 @@ class HybridMemoryStore:
         self._timeseries = TimeSeriesMemoryStore()
 
     def store_data(self, ins_id: str, data: Dict[str, Any]):
-        self._cache.set(f"data:{ins_id}:latest", data, ttl=300)
         self._timeseries.store_metrics(ins_id, data)
 
     def get_latest(self, ins_id: str) -> Optional[Dict]:
-        return self._cache.get(f"data:{ins_id}:latest")
+        # The time-series latest snapshot is already up to date; no need to
+        # keep a second copy in the TTL cache
+        entry = self._timeseries.get_latest(ins_id)
+        return entry.data if entry else None
 
-    def get_all_latest(self) -> Dict[str, Dict]:
+    def get_all_latest(self) -> Mapping[str, _Entry]:
         return self._timeseries.get_all_latest()
-    
+
+    @property
+    def version(self) -> int:
+        return self._timeseries.version
+
     def get_positions(self, last_minutes: int = 5) -> Dict[str, List]:
-        all_latest = self._timeseries.get_all_recent(minutes=last_minutes)
-        positions = {}
-        for k, d in all_latest.items():
-            positions[k] = []
-            for v in d:
-                if v.get('data').get('online'):
-                    ekf = v.get('data').get('ins_measurement').get('ekf')
-                    positions[k].append([ekf.get('latitude'), ekf.get('longitude')])
-        return positions
+        return self._timeseries.get_positions(last_minutes=last_minutes)
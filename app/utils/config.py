@@ -1,31 +1,30 @@
 import itertools
-import json
 
-from app.models.config import INSConfig
-from typing import List
+import orjson
+
+from app.models.config import INSConfig, INSConfigIndex
 
 colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6',
           '#1abc9c', '#e67e22', '#34495e', '#e91e63', '#00bcd4']
 color_cycle = itertools.cycle(colors)
 
-def get_ins_configs(json_path: str) -> List[INSConfig]:
+# Mandatory fields copied verbatim per connection type; unknown types are
+# skipped, missing mandatory fields raise KeyError as before
+_CONFIG_FIELDS = {
+    'ethernet': ('id', 'name', 'connection_type', 'ip_address'),
+    'fake': ('id', 'name', 'connection_type'),
+}
+
+def get_ins_configs(json_path: str) -> INSConfigIndex:
+    with open(json_path, 'rb') as f:
+        configs_json_data = orjson.loads(f.read())
+
     ins_configs = []
-    with open(json_path, 'r') as f:
-        configs_json_data = json.load(f)
-        for config_json_data in configs_json_data:
-            if config_json_data["connection_type"] == 'ethernet':
-                ins_configs.append(INSConfig(
-                    id=config_json_data["id"],
-                    name=config_json_data["name"],
-                    color=config_json_data.get("color", next(color_cycle)),
-                    connection_type=config_json_data["connection_type"],
-                    ip_address=config_json_data["ip_address"]
-                ))
-            elif config_json_data["connection_type"] == 'fake':
-                ins_configs.append(INSConfig(
-                    id=config_json_data["id"],
-                    name=config_json_data["name"],
-                    color=config_json_data.get("color", next(color_cycle)),
-                    connection_type=config_json_data["connection_type"]
-                ))
-    return ins_configs
+    for config_json_data in configs_json_data:
+        fields = _CONFIG_FIELDS.get(config_json_data["connection_type"])
+        if fields is None:
+            continue
+        kwargs = {k: config_json_data[k] for k in fields}
+        kwargs['color'] = config_json_data.get("color", next(color_cycle))
+        ins_configs.append(INSConfig(**kwargs))
+    return INSConfigIndex.from_configs(ins_configs)
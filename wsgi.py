@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""WSGI entrypoint, e.g.:
+
+    gunicorn -k gevent -w 1 -b 0.0.0.0:5000 wsgi:app
+
+Keep a single worker: the monitor thread and the in-memory store live in
+this process, so more workers would each poll the INS and hold their own
+partial state.
+"""
+import logging
+
+from app.utils.config import get_ins_configs
+from app import create_app
+from app.monitoring import create_monitor
+
+# Logging configuration
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Load app config
+ins_configs = get_ins_configs('config.json')
+
+# Create and start monitor
+monitor = create_monitor(ins_configs=ins_configs)
+monitor.start()
+
+# Create flask app
+app = create_app(ins_configs=ins_configs)